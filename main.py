@@ -4,12 +4,33 @@ Simple fullscreen CLI UI with a centered message box and scroll listener.
 Usage: python main.py
 """
 
+import bisect
 import curses
+import functools
+import itertools
+import math
 import random
 import time
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Hashable, Optional, Sequence
+
+
+class Screen(IntEnum):
+    IDLE = 0
+    PLAYER_INPUT = 1
+    WORD_COUNT = 2
+    IMPOSTER_PERCENT = 3
+    WORD_ENTRY = 4
+    RANDOM_PICK = 5
+    CONFIRM = 6
+    MODE_SELECT = 7
+    RANDOM_SIMPLE = 8
+    WAIT_SCROLL = 9
+    REVEAL = 10
+    HANDOFF = 11
+    DONE = 12
 
 
 @dataclass
@@ -33,6 +54,15 @@ class GameMode:
     source: str  # all, nouns, verbs, player, back
 
 
+@dataclass
+class TextEntry:
+    buffer_attr: str  # name of the ui_state bytearray being edited
+    refresh: Callable[[], None]
+    accepts: Callable[[int], bool]
+    on_enter: Optional[Callable[[], None]] = None  # Enter action when not in ENTER_GO_SCREENS
+    value_attr: str = ""  # ui_state int kept equal to the digits in the buffer, if any
+
+
 @dataclass
 class ScrollState:
     active: bool = False
@@ -43,13 +73,18 @@ class ScrollState:
 
 @dataclass
 class UIState:
-    screen: str = "idle"  # idle, player_input, word_count, imposter_percent, confirm, mode_select, word_entry, random_pick, wait_scroll, reveal, handoff, done
-    input_buffer: str = ""
-    word_count_buffer: str = ""
-    imposter_percent_buffer: str = ""
+    screen: Screen = Screen.IDLE
+    # Typed text is kept in bytearrays (appended in place, decoded only for display).
+    input_buffer: bytearray = field(default_factory=bytearray)
+    word_count_buffer: bytearray = field(default_factory=bytearray)
+    imposter_percent_buffer: bytearray = field(default_factory=bytearray)
+    # Numbers typed into the digit buffers, updated per key instead of reparsed.
+    input_value: int = 0
+    word_count_value: int = 0
+    imposter_percent_value: int = 0
     player_count: int = 0
     word_options_count: int = 0
-    word_buffer: str = ""
+    word_buffer: bytearray = field(default_factory=bytearray)
     chosen_word: str = ""
     mode_index: int = 0
     selected_mode: Optional[GameMode] = None
@@ -62,13 +97,17 @@ class UIState:
     handoff_pending_action: str = ""
     imposter_all_chance: int = 0
     all_imposter_except_first: bool = False
-    random_candidates: list[str] = None  # type: ignore
-    random_filter: str = ""
+    random_candidates: list[tuple[str, str]] = None  # type: ignore  # (word, word.lower())
+    random_filter: bytearray = field(default_factory=bytearray)
     scroll_block_until: float = 0.0
     simple_candidates: list[str] = None  # type: ignore
     simple_index: int = 0
     simple_hold_started: bool = False
     simple_hold_until: float = 0.0
+    hold_remaining: int = -1  # seconds shown in the hold countdown text, -1 when not shown
+    reveal_remaining: int = -1  # seconds behind reveal_label, the cached reveal countdown text
+    reveal_label: str = ""
+    dirty: bool = True  # set by state changes; the main loop only renders when dirty
 
 
 message_box = MessageBox()
@@ -80,6 +119,22 @@ BACK_DIRECTION = "up"
 scroll_state = ScrollState()
 ui_state = UIState()
 
+# Texts shorter than this are wrapped for even line lengths instead of greedily.
+OPTIMAL_WRAP_MAX_CHARS = 200
+
+# Shadow buffers for damage-tracked rendering: (y, x) -> (char, attr).
+# Each frame is drawn into new_cells, then only cells differing from prev_cells reach curses.
+prev_cells: dict[tuple[int, int], tuple[str, int]] = {}
+new_cells: dict[tuple[int, int], tuple[str, int]] = {}
+frame_size: list[int] = [0, 0]
+
+ARROW_UP = "↑"
+ARROW_DOWN = "↓"
+
+# Row strings reused across frames, keyed by box width.
+fill_rows: dict[int, str] = {}
+border_rows: dict[int, tuple[str, str]] = {}
+
 # Treat events within this window as one continuous scroll.
 # Debounce scrolls for eight-tenths of a second to avoid double triggers (wheel and arrows alike).
 SCROLL_BUFFER_SECONDS = 0.8
@@ -88,23 +143,24 @@ MIN_SCROLL_INTERVAL = SCROLL_BUFFER_SECONDS
 
 WORDS_PATH = Path(__file__).with_name("words.txt")
 
-def load_words(path: Path = WORDS_PATH) -> list[str]:
+def load_words(path: Path = WORDS_PATH) -> tuple[str, ...]:
     try:
         raw_lines = path.read_text(encoding="utf-8").splitlines()
     except OSError:
-        return []
-    words: list[str] = []
-    seen: set[str] = set()
-    for line in raw_lines:
-        word = line.strip()
-        if not word or word in seen:
-            continue
-        seen.add(word)
-        words.append(word)
-    return words
+        return ()
+    # dict.fromkeys de-duplicates while keeping the file order.
+    return tuple(dict.fromkeys(word for word in (line.strip() for line in raw_lines) if word))
 
 
 WORDS = load_words()
+# Lowercased once at load so filter scoring never lowercases per frame.
+WORD_PAIRS = tuple((word, word.lower()) for word in WORDS)
+
+# Dedicated generator instead of the module-level functions of random.
+RNG = random.Random()
+# Reusable shuffled copies of the word pools as (pool, scratch), keyed by pool identity.
+# The pool is kept alongside so its id cannot be reused by another sequence while cached.
+shuffle_pools: dict[int, tuple[Sequence, list]] = {}
 
 DEFAULT_STYLE = BoxStyle()
 IMPOSTER_STYLE = BoxStyle(fill_pair=3, text_pair=11, border_pair=11)
@@ -117,18 +173,33 @@ GAME_MODES = [
 ]
 
 
+# The setters only mark the UI dirty on a real change, so re-applying the same content
+# does not trigger a redraw.
 def set_message_box_title(title: str) -> None:
+    if message_box.title == title:
+        return
     message_box.title = title
+    ui_state.dirty = True
 
 
 def set_message_box_text(text: str) -> None:
+    if message_box.text == text:
+        return
     message_box.text = text
+    ui_state.dirty = True
 
 
 def set_box_style(style: BoxStyle) -> None:
+    if (
+        box_style.fill_pair == style.fill_pair
+        and box_style.text_pair == style.text_pair
+        and box_style.border_pair == style.border_pair
+    ):
+        return
     box_style.fill_pair = style.fill_pair
     box_style.text_pair = style.text_pair
     box_style.border_pair = style.border_pair
+    ui_state.dirty = True
 
 
 def is_current_imposter() -> bool:
@@ -143,54 +214,133 @@ def is_current_imposter() -> bool:
     return ui_state.imposter_index is not None and ui_state.current_player == ui_state.imposter_index
 
 
-def wrap_text(text: str, width: int) -> list[str]:
+@functools.lru_cache(maxsize=64)
+def wrap_text(text: str, width: int) -> tuple[str, ...]:
+    # Cached: the text only changes on state transitions, so most frames reuse the result.
     if width <= 0:
-        return [text]
+        return (text,)
     lines: list[str] = []
     for raw_line in text.splitlines() or [""]:
         words = raw_line.split(" ")
-        current = ""
-        for word in words:
-            if not current:
-                if len(word) <= width:
-                    current = word
-                else:
-                    for i in range(0, len(word), width):
-                        lines.append(word[i : i + width])
-                    current = ""
-            elif len(current) + 1 + len(word) <= width:
-                current += " " + word
-            else:
-                lines.append(current)
-                if len(word) <= width:
-                    current = word
-                else:
-                    for i in range(0, len(word), width):
-                        chunk = word[i : i + width]
-                        if len(chunk) == width:
-                            lines.append(chunk)
-                        else:
-                            current = chunk
-                            break
-                    else:
-                        current = ""
-        if current:
-            lines.append(current)
-    return lines or [""]
-
-
-def safe_addstr(stdscr: curses.window, y: int, x: int, s: str, attr: int = 0) -> None:
+        count = len(words)
+        # offsets[i] is the length of words[:i] with one separator after each word, so the
+        # break point of a line can be found by bisecting instead of walking word by word.
+        offsets = list(itertools.accumulate((len(word) + 1 for word in words), initial=0))
+        head = ""  # first piece of the current line; may be the tail of a broken word
+        i = 0
+        while i < count or head:
+            if not head:
+                word = words[i]
+                i += 1
+                if not word:
+                    continue  # empty words (repeated spaces) never start a line
+                if len(word) > width:
+                    lines.extend(word[k : k + width] for k in range(0, len(word), width))
+                    continue
+                head = word
+            end = bisect.bisect_right(offsets, offsets[i] + width - len(head), i, count + 1) - 1
+            lines.append(" ".join([head, *words[i:end]]))
+            head = ""
+            i = end
+            if i < count and len(words[i]) > width:
+                # Word longer than the line: full chunks get their own lines, the rest carries on.
+                word = words[i]
+                i += 1
+                full = len(word) - len(word) % width
+                lines.extend(word[k : k + width] for k in range(0, full, width))
+                head = word[full:]
+    return tuple(lines) or ("",)
+
+
+@functools.lru_cache(maxsize=64)
+def wrap_text_optimal(text: str, width: int) -> tuple[str, ...]:
+    """Minimum-raggedness wrap: minimise the squared trailing space of every line but the last.
+
+    Quadratic in the number of words per line, so only meant for the short box texts.
+    """
+    if width <= 0:
+        return (text,)
+    lines: list[str] = []
+    for raw_line in text.splitlines() or [""]:
+        words = raw_line.split(" ")
+        # Runs of spaces and overlong words keep the greedy layout, which preserves them.
+        if any(not word or len(word) > width for word in words):
+            return wrap_text(text, width)
+        count = len(words)
+        # cost[i] is the best cost of wrapping words[i:], next_break[i] where its first line ends.
+        cost = [0] * (count + 1)
+        next_break = [count] * (count + 1)
+        for i in range(count - 1, -1, -1):
+            best = -1
+            line_len = -1
+            for j in range(i + 1, count + 1):
+                line_len += len(words[j - 1]) + 1
+                if line_len > width:
+                    break
+                candidate = cost[j] + (0 if j == count else (width - line_len) ** 2)
+                if best < 0 or candidate < best:
+                    best = candidate
+                    next_break[i] = j
+            cost[i] = best
+        i = 0
+        while i < count:
+            lines.append(" ".join(words[i : next_break[i]]))
+            i = next_break[i]
+    return tuple(lines) or ("",)
+
+
+# Both writers clip to the screen and skip the bottom-right cell, which curses cannot
+# write without raising, so flush_cells never expects a curses.error.
+def safe_addstr(y: int, x: int, s: str, attr: int = 0) -> None:
+    h, w = frame_size
+    if not 0 <= y < h:
+        return
+    start = max(x, 0)
+    end = min(x + len(s), w - 1 if y == h - 1 else w)
+    if start >= end:
+        return
+    # The whole clipped slice goes in with one update; zip builds the cell entries in C.
+    cells = zip(s[start - x : end - x], itertools.repeat(attr))
+    new_cells.update(zip(zip(itertools.repeat(y), range(start, end)), cells))
+
+
+def safe_addch(y: int, x: int, ch: str, attr: int = 0) -> None:
+    h, w = frame_size
+    if 0 <= y < h and 0 <= x < (w - 1 if y == h - 1 else w):
+        new_cells[(y, x)] = (ch, attr)
+
+
+def flush_cells(stdscr: curses.window) -> None:
+    changed = {key: cell for key, cell in new_cells.items() if prev_cells.get(key) != cell}
+    for key in prev_cells.keys() - new_cells.keys():
+        changed[key] = (" ", 0)
+
+    # Coalesce consecutive same-row, same-attr cells into a single addstr.
+    runs: list[tuple[int, int, list[str], int]] = []
+    for (y, x) in sorted(changed):
+        ch, attr = changed[(y, x)]
+        if runs:
+            run_y, run_x, run_chars, run_attr = runs[-1]
+            if y == run_y and x == run_x + len(run_chars) and attr == run_attr:
+                run_chars.append(ch)
+                continue
+        runs.append((y, x, [ch], attr))
+
     try:
-        stdscr.addstr(y, x, s, attr)
+        for y, x, run_chars, attr in runs:
+            stdscr.addstr(y, x, "".join(run_chars), attr)
     except curses.error:
-        pass
+        # Only possible if the terminal changed size mid-frame; repaint fully next time.
+        frame_size[:] = [0, 0]
 
+    prev_cells.clear()
+    prev_cells.update(new_cells)
+    new_cells.clear()
 
-def safe_addch(stdscr: curses.window, y: int, x: int, ch: str, attr: int = 0) -> None:
-    try:
-        stdscr.addch(y, x, ch, attr)
-    except curses.error:
-        pass
+
+COLOR_PAIRS = (1, 2, 3, 4, 5, 6, 7, 8, 11)
+# Composed color pair + attribute values, keyed by (pair, bold, dim); filled by init_colors.
+ATTR_CACHE: dict[tuple[int, bool, bool], int] = {}
 
 
 def init_colors() -> None:
@@ -205,127 +355,170 @@ def init_colors() -> None:
     curses.init_pair(7, curses.COLOR_CYAN, curses.COLOR_BLACK)    # subtle blue tint
     curses.init_pair(8, curses.COLOR_RED, curses.COLOR_BLACK)     # imposter red outline/text (bold red)
     curses.init_pair(11, curses.COLOR_RED, curses.COLOR_BLACK)    # strong red for text/borders
+    ATTR_CACHE.clear()
+    for pair in COLOR_PAIRS:
+        for bold in (False, True):
+            for dim in (False, True):
+                attr(pair, bold, dim)
+
+
+def attr(pair: int, bold: bool = False, dim: bool = False) -> int:
+    key = (pair, bold, dim)
+    value = ATTR_CACHE.get(key)
+    if value is None:
+        value = curses.color_pair(pair)
+        if bold:
+            value |= curses.A_BOLD
+        if dim:
+            value |= curses.A_DIM
+        ATTR_CACHE[key] = value
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def highlight_segments(line: str, highlight_lower: str, limit: int) -> tuple[tuple[int, str, bool], ...]:
+    """Split a line into (x offset, text, bold) runs, bolding words equal to highlight_lower."""
+    segments: list[tuple[int, str, bool]] = []
+
+    def add(offset: int, text: str, bold: bool) -> None:
+        if segments:
+            prev_offset, prev_text, prev_bold = segments[-1]
+            if prev_bold == bold and prev_offset + len(prev_text) == offset:
+                segments[-1] = (prev_offset, prev_text + text, bold)
+                return
+        segments.append((offset, text, bold))
+
+    cursor = 0
+    for idx, word in enumerate(line.split(" ")):
+        if idx > 0:
+            add(cursor, " ", False)
+            cursor += 1
+        add(cursor, word[:limit], word.lower() == highlight_lower)
+        cursor += len(word)
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=32)
+def box_geometry(h: int, w: int, content_width: int, line_count: int) -> tuple[int, int, int, int, int]:
+    """Box layout as (box_width, box_height, start_y, start_x, arrow_x)."""
+    padding_x = 4
+    max_width = max(10, w - 4)
+    box_width = min(max_width, max(20, content_width + padding_x * 2))
+    box_height = max(7, 6 + line_count)
+    start_y = max(1, (h - box_height) // 2)
+    start_x = max(1, (w - box_width) // 2)
+    arrow_x = start_x + (box_width - 1) // 2
+    return box_width, box_height, start_y, start_x, arrow_x
 
 
 def draw_message_box(stdscr: curses.window, now: float, highlight_word: Optional[str] = None) -> None:
     h, w = stdscr.getmaxyx()
-    padding_x = 4
     wrap_width = max(10, w - 10)
-    lines = wrap_text(message_box.text, wrap_width)
+    # Typed text is wrapped greedily so it shows exactly as entered while it grows.
+    if len(message_box.text) < OPTIMAL_WRAP_MAX_CHARS and TEXT_ENTRIES[ui_state.screen] is None:
+        lines = wrap_text_optimal(message_box.text, wrap_width)
+    else:
+        lines = wrap_text(message_box.text, wrap_width)
     content_width = max(len(message_box.title), max((len(line) for line in lines), default=0))
-    max_width = max(10, w - 4)
-    box_width = min(max_width, max(20, content_width + padding_x * 2))
-    box_height = max(7, 6 + len(lines))
-    start_y = max(1, (h - box_height) // 2)
-    start_x = max(1, (w - box_width) // 2)
+    box_width, box_height, start_y, start_x, arrow_x = box_geometry(h, w, content_width, len(lines))
 
     # Arrow indicators during mode selection or simple random browse (single arrows only)
-    if ui_state.screen in ("mode_select", "random_simple"):
-        indicator_attr = curses.color_pair(2) | curses.A_BOLD
-        arrow_up = "↑"
-        arrow_down = "↓"
-        arrow_x = start_x + (box_width - 1) // 2
-        arrow_up_y = start_y - 2
-        if arrow_up_y >= 0:
-            stdscr.attrset(indicator_attr)
-            safe_addstr(stdscr, arrow_up_y, arrow_x, arrow_up)
-        if ui_state.screen == "random_simple":
-            arrow_down_y = start_y + box_height + 1
-            if arrow_down_y < h:
-                stdscr.attrset(indicator_attr)
-                safe_addstr(stdscr, arrow_down_y, arrow_x, arrow_down)
+    if ui_state.screen in (Screen.MODE_SELECT, Screen.RANDOM_SIMPLE):
+        indicator_attr = attr(2, bold=True)
+        safe_addstr(start_y - 2, arrow_x, ARROW_UP, indicator_attr)
+        if ui_state.screen is Screen.RANDOM_SIMPLE:
+            safe_addstr(start_y + box_height + 1, arrow_x, ARROW_DOWN, indicator_attr)
 
     # Reveal countdown indicator
-    if ui_state.screen == "reveal":
+    if ui_state.screen is Screen.REVEAL:
         remaining = max(0, int((ui_state.reveal_until - now) + 0.999))
-        label = f"{remaining}"
+        if remaining != ui_state.reveal_remaining:
+            ui_state.reveal_remaining = remaining
+            ui_state.reveal_label = f"{remaining}"
+        label = ui_state.reveal_label
         label_y = start_y - 3
-        if label_y >= 0:
-            label_x = start_x + (box_width - len(label)) // 2
-            stdscr.attrset(curses.color_pair(5) | curses.A_BOLD)
-            safe_addstr(stdscr, label_y, label_x, label)
-
-    fill_attr = curses.color_pair(box_style.fill_pair)
-    if box_style.border_pair != 11:
-        fill_attr |= curses.A_DIM
-    fill_x_start = start_x + (0 if ui_state.screen == "handoff" else 1)
-    fill_x_end = start_x + box_width - (0 if ui_state.screen == "handoff" else 1)
-    fill_y_start = start_y + (0 if ui_state.screen == "handoff" else 1)
-    fill_y_end = start_y + box_height - (0 if ui_state.screen == "handoff" else 1)
+        label_x = start_x + (box_width - len(label)) // 2
+        safe_addstr(label_y, label_x, label, attr(5, bold=True))
+
+    fill_attr = attr(box_style.fill_pair, dim=box_style.border_pair != 11)
+    fill_x_start = start_x + (0 if ui_state.screen is Screen.HANDOFF else 1)
+    fill_x_end = start_x + box_width - (0 if ui_state.screen is Screen.HANDOFF else 1)
+    fill_y_start = start_y + (0 if ui_state.screen is Screen.HANDOFF else 1)
+    fill_y_end = start_y + box_height - (0 if ui_state.screen is Screen.HANDOFF else 1)
+    fill_width = fill_x_end - fill_x_start
+    fill_row = fill_rows.get(fill_width)
+    if fill_row is None:
+        fill_row = fill_rows[fill_width] = " " * fill_width
     for y in range(fill_y_start, fill_y_end):
-        for x in range(fill_x_start, fill_x_end):
-            safe_addch(stdscr, y, x, " ", fill_attr)
+        safe_addstr(y, fill_x_start, fill_row, fill_attr)
 
     # Border with box-drawing characters (skip for handoff screen)
-    use_imposter_style = ui_state.screen == "reveal" and is_current_imposter()
+    use_imposter_style = ui_state.screen is Screen.REVEAL and is_current_imposter()
     if use_imposter_style:
-        border_attr = curses.color_pair(IMPOSTER_STYLE.border_pair) | curses.A_BOLD
-        title_attr = curses.color_pair(IMPOSTER_STYLE.text_pair) | curses.A_BOLD
-        body_attr = curses.color_pair(IMPOSTER_STYLE.text_pair)
+        border_attr = attr(IMPOSTER_STYLE.border_pair, bold=True)
+        title_attr = attr(IMPOSTER_STYLE.text_pair, bold=True)
+        body_attr = attr(IMPOSTER_STYLE.text_pair)
     else:
-        border_attr = curses.color_pair(box_style.border_pair) | curses.A_BOLD
-        title_attr = curses.color_pair(box_style.text_pair) | curses.A_BOLD
-        body_attr = curses.color_pair(box_style.text_pair)
-
-    if ui_state.screen != "handoff":
-        border_top = "┌" + "─" * (box_width - 2) + "┐"
-        border_bottom = "└" + "─" * (box_width - 2) + "┘"
-        stdscr.attrset(border_attr)
-        safe_addstr(stdscr, start_y, start_x, border_top, border_attr)
+        border_attr = attr(box_style.border_pair, bold=True)
+        title_attr = attr(box_style.text_pair, bold=True)
+        body_attr = attr(box_style.text_pair)
+
+    if ui_state.screen is not Screen.HANDOFF:
+        borders = border_rows.get(box_width)
+        if borders is None:
+            inner = "─" * (box_width - 2)
+            borders = border_rows[box_width] = ("┌" + inner + "┐", "└" + inner + "┘")
+        border_top, border_bottom = borders
+        safe_addstr(start_y, start_x, border_top, border_attr)
+        right_x = start_x + box_width - 1
         for y in range(start_y + 1, start_y + box_height - 1):
-            safe_addstr(stdscr, y, start_x, "│", border_attr)
-            safe_addstr(stdscr, y, start_x + box_width - 1, "│", border_attr)
-        safe_addstr(stdscr, start_y + box_height - 1, start_x, border_bottom, border_attr)
+            safe_addch(y, start_x, "│", border_attr)
+            safe_addch(y, right_x, "│", border_attr)
+        safe_addstr(start_y + box_height - 1, start_x, border_bottom, border_attr)
 
     title_x = start_x + (box_width - len(message_box.title)) // 2
-    stdscr.attrset(title_attr)
-    safe_addstr(stdscr, start_y + 2, title_x, message_box.title[: box_width - 2], title_attr)
-    stdscr.attrset(body_attr)
+    safe_addstr(start_y + 2, title_x, message_box.title[: box_width - 2], title_attr)
     text_start_y = start_y + 4
+    highlight_lower = highlight_word.lower() if highlight_word else ""
     for i, line in enumerate(lines):
         line_x = start_x + (box_width - len(line)) // 2
         if highlight_word:
-            words = line.split(" ")
-            cursor_x = line_x
-            for idx, word in enumerate(words):
-                if idx > 0:
-                    safe_addstr(stdscr, text_start_y + i, cursor_x, " ", body_attr)
-                    cursor_x += 1
-                attr = body_attr
-                if word.lower() == highlight_word.lower():
-                    attr |= curses.A_BOLD
-                safe_addstr(stdscr, text_start_y + i, cursor_x, word[: box_width - 2], attr)
-                cursor_x += len(word)
+            for offset, segment, bold in highlight_segments(line, highlight_lower, box_width - 2):
+                segment_attr = body_attr | curses.A_BOLD if bold else body_attr
+                safe_addstr(text_start_y + i, line_x + offset, segment, segment_attr)
         else:
-            safe_addstr(stdscr, text_start_y + i, line_x, line[: box_width - 2], body_attr)
+            safe_addstr(text_start_y + i, line_x, line[: box_width - 2], body_attr)
 
 
 def render(stdscr: curses.window) -> None:
-    stdscr.erase()
-    stdscr.bkgd(" ", curses.color_pair(1) | curses.A_DIM)
+    h, w = stdscr.getmaxyx()
+    if [h, w] != frame_size:
+        # After a resize the terminal contents are unknown; repaint everything.
+        frame_size[:] = [h, w]
+        prev_cells.clear()
+        stdscr.clear()
     now = time.monotonic()
     highlight_word = None
     if (
-        ui_state.screen == "random_simple"
+        ui_state.screen is Screen.RANDOM_SIMPLE
         and ui_state.simple_hold_started
         and ui_state.simple_hold_until > 0
     ):
-        remaining = max(0, int(ui_state.simple_hold_until - now + 0.999))
-        set_message_box_text(f"Auswahl in {remaining} sek")
-    if ui_state.screen == "random_pick" and ui_state.random_filter:
+        show_hold_countdown(now)
+    if ui_state.screen is Screen.RANDOM_PICK and ui_state.random_filter:
         highlight_word = best_random_choice()
-    if ui_state.screen == "reveal" and is_current_imposter():
+    if ui_state.screen is Screen.REVEAL and is_current_imposter():
         set_box_style(IMPOSTER_STYLE)
     draw_message_box(stdscr, now, highlight_word)
 
     # Footer
-    h, w = stdscr.getmaxyx()
     footer = "Imposter-CLI"
     footer_x = max(0, (w - len(footer)) // 2)
-    stdscr.attrset(curses.color_pair(4) | curses.A_BOLD)
-    stdscr.addstr(h - 2, footer_x, footer[: max(0, w - 1)])
+    safe_addstr(h - 2, footer_x, footer[: max(0, w - 1)], attr(4, bold=True))
 
-    stdscr.refresh()
+    flush_cells(stdscr)
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
 def handle_scroll(direction: str, now: float) -> None:
@@ -355,12 +548,15 @@ def update_scroll_state(now: float) -> None:
 
 
 def reset_idle() -> None:
-    ui_state.screen = "idle"
-    ui_state.input_buffer = ""
-    ui_state.word_count_buffer = ""
-    ui_state.imposter_percent_buffer = ""
+    ui_state.screen = Screen.IDLE
+    ui_state.input_buffer.clear()
+    ui_state.word_count_buffer.clear()
+    ui_state.imposter_percent_buffer.clear()
+    ui_state.input_value = 0
+    ui_state.word_count_value = 0
+    ui_state.imposter_percent_value = 0
     ui_state.word_options_count = 0
-    ui_state.word_buffer = ""
+    ui_state.word_buffer.clear()
     ui_state.player_count = 0
     ui_state.chosen_word = ""
     ui_state.selected_mode = None
@@ -375,8 +571,11 @@ def reset_idle() -> None:
     ui_state.all_imposter_except_first = False
     ui_state.simple_hold_started = False
     ui_state.simple_hold_until = 0.0
+    ui_state.hold_remaining = -1
+    ui_state.reveal_remaining = -1
+    ui_state.reveal_label = ""
     ui_state.random_candidates = []
-    ui_state.random_filter = ""
+    ui_state.random_filter.clear()
     set_box_style(DEFAULT_STYLE)
     set_message_box_title("Imposter-CLI")
     set_message_box_text("Zum Starten scrollen")
@@ -384,48 +583,56 @@ def reset_idle() -> None:
     ui_state.simple_index = 0
 
 
+# What each text entry screen last displayed: its buffer, or for random_pick the chosen title.
+shown_state: dict[Screen, Hashable] = {}
+
+
+def already_shown(screen: Screen, visible: Hashable) -> bool:
+    """True if screen is active and already shows visible, so its enter_* call can be skipped."""
+    if ui_state.screen is screen and shown_state.get(screen) == visible:
+        return True
+    shown_state[screen] = visible
+    return False
+
+
 def enter_player_input() -> None:
-    ui_state.screen = "player_input"
+    if already_shown(Screen.PLAYER_INPUT, bytes(ui_state.input_buffer)):
+        return
+    ui_state.screen = Screen.PLAYER_INPUT
     set_box_style(DEFAULT_STYLE)
     title = "Spieleranzahl eingeben"
-    body = ui_state.input_buffer or "Zahl tippen..."
+    body = ui_state.input_buffer.decode() or "Zahl tippen..."
     set_message_box_title(title)
     set_message_box_text(body)
 
 
 def enter_word_count_input() -> None:
-    ui_state.screen = "word_count"
+    if already_shown(Screen.WORD_COUNT, bytes(ui_state.word_count_buffer)):
+        return
+    ui_state.screen = Screen.WORD_COUNT
     set_box_style(DEFAULT_STYLE)
     title = "Anzahl Wortoptionen"
-    body = ui_state.word_count_buffer or "Zahl tippen..."
+    body = ui_state.word_count_buffer.decode() or "Zahl tippen..."
     set_message_box_title(title)
     set_message_box_text(body)
-    ui_state.imposter_percent_buffer = ui_state.imposter_percent_buffer or ""
 
 
 def enter_imposter_percent_input() -> None:
-    ui_state.screen = "imposter_percent"
+    if already_shown(Screen.IMPOSTER_PERCENT, bytes(ui_state.imposter_percent_buffer)):
+        return
+    ui_state.screen = Screen.IMPOSTER_PERCENT
     set_box_style(DEFAULT_STYLE)
     title = "Prozent: alle sind Imposter"
-    body = ui_state.imposter_percent_buffer or "0-100 eingeben"
+    body = ui_state.imposter_percent_buffer.decode() or "0-100 eingeben"
     set_message_box_title(title)
     set_message_box_text(body)
 
 
 def enter_confirm() -> None:
-    ui_state.screen = "confirm"
-    try:
-        ui_state.player_count = max(1, int(ui_state.input_buffer))
-    except ValueError:
-        ui_state.player_count = 1
-    try:
-        ui_state.word_options_count = max(0, int(ui_state.word_count_buffer or "0"))
-    except ValueError:
-        ui_state.word_options_count = 0
-    try:
-        ui_state.imposter_all_chance = max(0, min(100, int(ui_state.imposter_percent_buffer or "0")))
-    except ValueError:
-        ui_state.imposter_all_chance = 0
+    ui_state.screen = Screen.CONFIRM
+    ui_state.player_count = max(1, ui_state.input_value)
+    ui_state.word_options_count = ui_state.word_count_value
+    ui_state.imposter_all_chance = min(100, ui_state.imposter_percent_value)
     set_box_style(DEFAULT_STYLE)
     set_message_box_title("Passt")
     set_message_box_text(
@@ -434,10 +641,12 @@ def enter_confirm() -> None:
 
 
 def enter_word_entry() -> None:
-    ui_state.screen = "word_entry"
+    if already_shown(Screen.WORD_ENTRY, bytes(ui_state.word_buffer)):
+        return
+    ui_state.screen = Screen.WORD_ENTRY
     set_box_style(DEFAULT_STYLE)
     set_message_box_title("Geheimes Wort eingeben")
-    display = ui_state.word_buffer if ui_state.word_buffer else "Wort tippen..."
+    display = ui_state.word_buffer.decode() if ui_state.word_buffer else "Wort tippen..."
     set_message_box_text(display)
 
 
@@ -450,7 +659,7 @@ def show_mode(index: int) -> None:
 
 
 def enter_modes() -> None:
-    ui_state.screen = "mode_select"
+    ui_state.screen = Screen.MODE_SELECT
     if ui_state.mode_index >= len(GAME_MODES):
         ui_state.mode_index = 0
     show_mode(ui_state.mode_index)
@@ -465,7 +674,7 @@ def select_mode() -> None:
     set_box_style(current.style)
     pending_action = ""
     if current.source == "player":
-        ui_state.word_buffer = ""
+        ui_state.word_buffer.clear()
         pending_action = "enter_word_entry"
     elif current.source == "random":
         pending_action = "start_random_flow"
@@ -476,11 +685,53 @@ def select_mode() -> None:
     start_handoff(time.monotonic(), advance_after=False, pending_action=pending_action)
 
 
+def sample_indices(n: int, k: int) -> list[int]:
+    """Floyd's algorithm: k distinct indices below n, hashing only small ints."""
+    chosen: set[int] = set()
+    result: list[int] = []
+    for j in range(n - k, n):
+        t = RNG.randrange(j + 1)
+        if t in chosen:
+            t = j
+        chosen.add(t)
+        result.append(t)
+    # Floyd picks a uniform set but not a uniform order; the first candidate is shown first.
+    RNG.shuffle(result)
+    return result
+
+
+def sample_pool(pool: Sequence, k: int) -> list:
+    """Return min(k, len(pool)) distinct items of pool in random order.
+
+    Large draws reuse a copy of pool, so pool must not be mutated in place between calls.
+    """
+    n = len(pool)
+    k = min(k, n)
+    if k * 2 < n:
+        return [pool[i] for i in sample_indices(n, k)]
+    # Drawing most of the pool: run a partial Fisher-Yates over a kept copy instead of
+    # letting sample() copy the whole pool on every call.
+    cached = shuffle_pools.get(id(pool))
+    if cached is not None and cached[0] is pool and len(cached[1]) == n:
+        scratch = cached[1]
+    else:
+        scratch = list(pool)
+        shuffle_pools[id(pool)] = (pool, scratch)
+    for i in range(k):
+        j = RNG.randrange(i, n)
+        scratch[i], scratch[j] = scratch[j], scratch[i]
+    return scratch[:k]
+
+
 def choose_word_for_source(source: str) -> str:
     pool = WORDS
     if not pool:
         return "mystery"
-    return random.choice(pool)
+    return RNG.choice(pool)
+
+
+# Lowest player index that may be the imposter, per word source.
+IMPOSTER_LOW = {"player": 1, "random": 1, "random_simple": 1}
 
 
 def assign_imposter() -> None:
@@ -489,7 +740,7 @@ def assign_imposter() -> None:
         ui_state.all_imposter_except_first = False
         return
     ui_state.all_imposter_except_first = False
-    roll = random.randint(1, 100)
+    roll = RNG.randint(1, 100)
     if roll <= ui_state.imposter_all_chance:
         include_first = ui_state.word_options_count <= 1 and not (
             ui_state.selected_mode and ui_state.selected_mode.source == "player"
@@ -497,26 +748,14 @@ def assign_imposter() -> None:
         ui_state.imposter_index = -1
         ui_state.all_imposter_except_first = not include_first and ui_state.player_count > 1
         return
-    if ui_state.selected_mode and ui_state.selected_mode.source == "player":
-        ui_state.imposter_index = random.randint(1, ui_state.player_count - 1)
-    elif (
-        ui_state.selected_mode
-        and ui_state.selected_mode.source == "random"
-        and ui_state.word_options_count > 1
-    ):
-        ui_state.imposter_index = random.randint(1, ui_state.player_count - 1)
-    elif (
-        ui_state.selected_mode
-        and ui_state.selected_mode.source == "random_simple"
-        and ui_state.word_options_count > 1
-    ):
-        ui_state.imposter_index = random.randint(1, ui_state.player_count - 1)
-    else:
-        ui_state.imposter_index = random.randint(0, ui_state.player_count - 1)
+    # The first player picks the word in these modes, so they can never be the imposter.
+    source = ui_state.selected_mode.source if ui_state.selected_mode else ""
+    low = IMPOSTER_LOW.get(source, 0) if source == "player" or ui_state.word_options_count > 1 else 0
+    ui_state.imposter_index = RNG.randint(low, ui_state.player_count - 1)
 
 
 def start_waiting() -> None:
-    ui_state.screen = "wait_scroll"
+    ui_state.screen = Screen.WAIT_SCROLL
     player_num = ui_state.current_player + 1
     set_box_style(DEFAULT_STYLE)
     set_message_box_title("Wischen, um Wort zu erhalten")
@@ -524,7 +763,7 @@ def start_waiting() -> None:
 
 
 def start_reveal(now: float) -> None:
-    ui_state.screen = "reveal"
+    ui_state.screen = Screen.REVEAL
     ui_state.reveal_until = now + 3
     if is_current_imposter():
         set_box_style(IMPOSTER_STYLE)
@@ -537,7 +776,7 @@ def start_reveal(now: float) -> None:
 
 
 def start_handoff(now: float, advance_after: bool = True, pending_action: str = "") -> None:
-    ui_state.screen = "handoff"
+    ui_state.screen = Screen.HANDOFF
     ui_state.handoff_until = now + 3
     ui_state.handoff_advance = advance_after
     ui_state.handoff_pending_action = pending_action
@@ -549,7 +788,7 @@ def start_handoff(now: float, advance_after: bool = True, pending_action: str =
 def advance_player() -> None:
     ui_state.current_player += 1
     if ui_state.current_player >= ui_state.player_count:
-        ui_state.screen = "done"
+        ui_state.screen = Screen.DONE
         set_box_style(DEFAULT_STYLE)
         set_message_box_title("Fertig")
         set_message_box_text("Alle bereit – startet das Spiel!")
@@ -561,7 +800,7 @@ def prepare_word_and_start() -> None:
     if not ui_state.selected_mode:
         return
     if ui_state.selected_mode.source == "player":
-        ui_state.chosen_word = ui_state.word_buffer or "mystery"
+        ui_state.chosen_word = ui_state.word_buffer.decode() or "mystery"
     elif ui_state.selected_mode.source == "random" and ui_state.chosen_word:
         pass
     elif ui_state.selected_mode.source == "random_simple" and ui_state.chosen_word:
@@ -586,12 +825,12 @@ def start_random_flow() -> None:
     if ui_state.word_options_count <= 1:
         ui_state.chosen_word = choose_word_for_source("random")
         ui_state.random_candidates = []
-        ui_state.random_filter = ""
+        ui_state.random_filter.clear()
         prepare_word_and_start()
         return
 
-    ui_state.random_candidates = random.sample(WORDS, min(ui_state.word_options_count, len(WORDS)))
-    ui_state.random_filter = ""
+    ui_state.random_candidates = sample_pool(WORD_PAIRS, ui_state.word_options_count)
+    ui_state.random_filter.clear()
     enter_random_pick()
 
 
@@ -606,7 +845,7 @@ def start_random_simple() -> None:
     pool_size = len(WORDS)
     count = ui_state.word_options_count if ui_state.word_options_count > 0 else pool_size
     count = max(1, min(count, pool_size))
-    ui_state.simple_candidates = random.sample(WORDS, count)
+    ui_state.simple_candidates = sample_pool(WORDS, count)
     ui_state.simple_index = 0
     ui_state.simple_hold_started = False
     ui_state.simple_hold_until = 0.0
@@ -616,43 +855,88 @@ def start_random_simple() -> None:
 def enter_random_simple(now: float | None = None) -> None:
     if now is None:
         now = time.monotonic()
-    ui_state.screen = "random_simple"
+    ui_state.screen = Screen.RANDOM_SIMPLE
     set_box_style(IMPOSTER_STYLE)
     word = ui_state.simple_candidates[ui_state.simple_index] if ui_state.simple_candidates else "..."
     set_message_box_title(word.upper())
     if ui_state.simple_hold_started and ui_state.simple_hold_until > 0:
-        remaining = max(0, int(ui_state.simple_hold_until - now + 0.999))
-        set_message_box_text(f"Auswahl in {remaining} sek")
+        show_hold_countdown(now)
     else:
+        ui_state.hold_remaining = -1
         set_message_box_text("Scrollen zum Durchblättern")
 
 
+def show_hold_countdown(now: float) -> None:
+    # Only rebuild the text when the displayed second changes.
+    remaining = max(0, int(ui_state.simple_hold_until - now + 0.999))
+    if remaining != ui_state.hold_remaining:
+        ui_state.hold_remaining = remaining
+        set_message_box_text(f"Auswahl in {remaining} sek")
+
+
+def prefix_function(s: str) -> list[int]:
+    """KMP failure function: pi[i] is the longest proper border of s[: i + 1]."""
+    pi = [0] * len(s)
+    k = 0
+    for i in range(1, len(s)):
+        while k and s[i] != s[k]:
+            k = pi[k - 1]
+        if s[i] == s[k]:
+            k += 1
+        pi[i] = k
+    return pi
+
+
+def z_function(s: str) -> list[int]:
+    """z[i] is the length of the longest common prefix of s and s[i:]."""
+    n = len(s)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and s[z[i]] == s[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
+@functools.lru_cache(maxsize=1024)
+def tail_match_lens(filt: str, word: str) -> tuple[int, int]:
+    """Longest suffix of filt that starts word, and longest suffix of filt found anywhere in word.
+
+    Both run in O(len(filt) + len(word)); the separator keeps matches from crossing the two strings.
+    """
+    tail_pref = prefix_function(word + "\0" + filt)[-1]
+    rev_filt = filt[::-1]
+    tail_any = max(z_function(rev_filt + "\0" + word[::-1])[len(filt) + 1 :], default=0)
+    return tail_pref, tail_any
+
+
 def best_random_choice() -> str:
     candidates = ui_state.random_candidates or []
     if not candidates:
         return choose_word_for_source("random")
-    filt = ui_state.random_filter.lower()
+    filt = ui_state.random_filter.decode().lower()
     if not filt:
-        return candidates[0]
-
-    def tail_prefix_len(f: str, w: str) -> int:
-        limit = min(len(f), len(w))
-        for k in range(limit, 0, -1):
-            if w.startswith(f[-k:]):
-                return k
-        return 0
-
-    def tail_any_len(f: str, w: str) -> int:
-        limit = min(len(f), len(w))
-        for k in range(limit, 0, -1):
-            if f[-k:] in w:
-                return k
-        return 0
-
-    def score(word: str) -> tuple[int, int, int, int, int]:
-        w = word.lower()
-        tail_pref = tail_prefix_len(filt, w)
-        tail_any = tail_any_len(filt, w)
+        return candidates[0][0]
+    return best_match(filt, tuple(candidates))
+
+
+SCORE_FIELD_MASK = 0xFFF
+
+
+@functools.lru_cache(maxsize=32)
+def best_match(filt: str, candidates: tuple[tuple[str, str], ...]) -> str:
+    """Rank all candidates against filt in one batch.
+
+    Cached per filter, so the render, the title update and the final lock all share one ranking.
+    """
+
+    def score(pair: tuple[str, str]) -> int:
+        word, w = pair
+        tail_pref, tail_any = tail_match_lens(filt, w)
         # subsequence score
         idx = 0
         sub = 0
@@ -669,25 +953,35 @@ def best_random_choice() -> str:
                 prefix += 1
             else:
                 break
-        return tail_pref, tail_any, prefix, sub, -len(word)
+        # Pack (tail_pref, tail_any, prefix, sub, -len) into one int, 12 bits per field,
+        # so ranking compares plain ints instead of building a tuple per candidate.
+        return (
+            min(tail_pref, SCORE_FIELD_MASK) << 48
+            | min(tail_any, SCORE_FIELD_MASK) << 36
+            | min(prefix, SCORE_FIELD_MASK) << 24
+            | min(sub, SCORE_FIELD_MASK) << 12
+            | SCORE_FIELD_MASK - min(len(word), SCORE_FIELD_MASK)
+        )
 
-    best = max(candidates, key=lambda w: score(w))
-    return best
+    best_index = max(range(len(candidates)), key=lambda i: score(candidates[i]))
+    return candidates[best_index][0]
 
 
 def enter_random_pick() -> None:
-    ui_state.screen = "random_pick"
+    # Extra letters often keep the same best match; the candidate list below does not change on this screen.
+    title = best_random_choice().upper() if ui_state.random_filter else "Start Typing"
+    if already_shown(Screen.RANDOM_PICK, title):
+        return
+    ui_state.screen = Screen.RANDOM_PICK
     set_box_style(IMPOSTER_STYLE)
-    top = best_random_choice()
-    others = " ".join(ui_state.random_candidates) if ui_state.random_candidates else "keine"
-    title = top.upper() if ui_state.random_filter else "Start Typing"
+    others = " ".join(word for word, _ in ui_state.random_candidates) if ui_state.random_candidates else "keine"
     set_message_box_title(title)
     set_message_box_text(f"{others}")
 
 
 def lock_random_choice() -> None:
     ui_state.chosen_word = best_random_choice()
-    ui_state.random_filter = ""
+    ui_state.random_filter.clear()
     ui_state.random_candidates = []
     prepare_word_and_start()
 
@@ -704,7 +998,7 @@ def lock_random_simple_choice() -> None:
 
 def update_timers(now: float) -> None:
     if (
-        ui_state.screen == "random_simple"
+        ui_state.screen is Screen.RANDOM_SIMPLE
         and ui_state.simple_hold_started
         and ui_state.simple_hold_until > 0
         and now >= ui_state.simple_hold_until
@@ -712,14 +1006,14 @@ def update_timers(now: float) -> None:
         lock_random_simple_choice()
         return
 
-    if ui_state.screen == "reveal" and now >= ui_state.reveal_until:
+    if ui_state.screen is Screen.REVEAL and now >= ui_state.reveal_until:
         if ui_state.current_player + 1 >= ui_state.player_count:
             advance_player()
             ui_state.scroll_block_until = now + 1.0
         else:
             start_handoff(now, advance_after=True)
             ui_state.scroll_block_until = now + 1.0
-    elif ui_state.screen == "handoff" and now >= ui_state.handoff_until:
+    elif ui_state.screen is Screen.HANDOFF and now >= ui_state.handoff_until:
         if ui_state.handoff_pending_action:
             action = ui_state.handoff_pending_action
             ui_state.handoff_pending_action = ""
@@ -738,67 +1032,221 @@ def update_timers(now: float) -> None:
         ui_state.scroll_block_until = now + 1.0
 
 
+def countdown_deadline() -> Optional[float]:
+    """Deadline whose remaining seconds are currently shown on screen, if any."""
+    if ui_state.screen is Screen.REVEAL:
+        return ui_state.reveal_until
+    if ui_state.screen is Screen.RANDOM_SIMPLE and ui_state.simple_hold_started and ui_state.simple_hold_until > 0:
+        return ui_state.simple_hold_until
+    return None
+
+
+def countdown_changed(now: float) -> bool:
+    """True if the shown countdown would display a different number of seconds at now."""
+    deadline = countdown_deadline()
+    if deadline is None:
+        return False
+    shown = ui_state.reveal_remaining if ui_state.screen is Screen.REVEAL else ui_state.hold_remaining
+    return max(0, int(deadline - now + 0.999)) != shown
+
+
+def next_wakeup(now: float) -> Optional[float]:
+    """Earliest time the loop has to wake up without input, or None to block."""
+    deadlines: list[float] = []
+    if ui_state.screen is Screen.HANDOFF:
+        deadlines.append(ui_state.handoff_until)
+    if ui_state.scroll_block_until > now:
+        deadlines.append(ui_state.scroll_block_until)
+    if scroll_state.active:
+        deadlines.append(scroll_state.last_time + SCROLL_GAP_SECONDS)
+    countdown = countdown_deadline()
+    if countdown is not None:
+        deadlines.append(countdown)
+        # Wake when the displayed number of seconds changes.
+        remaining = countdown - now
+        if remaining > 0:
+            deadlines.append(countdown - (math.ceil(remaining) - 1))
+    return min(deadlines) if deadlines else None
+
+
+def input_timeout_ms(now: float) -> int:
+    """getch timeout: -1 blocks until input when no timer is pending."""
+    wakeup = next_wakeup(now)
+    if wakeup is None:
+        return -1
+    # Round up so the loop does not wake just before the deadline and spin once more.
+    return max(5, math.ceil((wakeup - now) * 1000))
+
+
 def on_direction(direction: str) -> None:
-    if ui_state.screen == "handoff":
-        return
-    if ui_state.screen == "wait_scroll":
-        start_reveal(time.monotonic())
-        return
-    if ui_state.screen == "reveal":
-        if ui_state.current_player + 1 >= ui_state.player_count:
-            advance_player()
-        else:
-            now = time.monotonic()
-            start_handoff(now, advance_after=True)
-            ui_state.scroll_block_until = now + 1.0
-        return
-    if ui_state.screen == "done":
-        enter_modes()
-        return
-    if ui_state.screen == "random_simple":
-        if direction in (GO_DIRECTION, BACK_DIRECTION):
-            length = len(ui_state.simple_candidates) if ui_state.simple_candidates else len(WORDS)
-            length = max(1, length)
-            delta = 1 if direction == GO_DIRECTION else -1
-            ui_state.simple_index = (ui_state.simple_index + delta) % length
-            ui_state.simple_hold_started = True
-            ui_state.simple_hold_until = time.monotonic() + 5.0
-            enter_random_simple(time.monotonic())
-        return
+    match ui_state.screen:
+        case Screen.HANDOFF:
+            return
+        case Screen.WAIT_SCROLL:
+            start_reveal(time.monotonic())
+            return
+        case Screen.REVEAL:
+            if ui_state.current_player + 1 >= ui_state.player_count:
+                advance_player()
+            else:
+                now = time.monotonic()
+                start_handoff(now, advance_after=True)
+                ui_state.scroll_block_until = now + 1.0
+            return
+        case Screen.DONE:
+            enter_modes()
+            return
+        case Screen.RANDOM_SIMPLE:
+            if direction in (GO_DIRECTION, BACK_DIRECTION):
+                length = len(ui_state.simple_candidates) if ui_state.simple_candidates else len(WORDS)
+                length = max(1, length)
+                delta = 1 if direction == GO_DIRECTION else -1
+                ui_state.simple_index = (ui_state.simple_index + delta) % length
+                ui_state.simple_hold_started = True
+                ui_state.simple_hold_until = time.monotonic() + 5.0
+                enter_random_simple(time.monotonic())
+            return
     if direction == GO_DIRECTION:
-        if ui_state.screen == "idle":
-            enter_player_input()
-        elif ui_state.screen == "player_input":
-            if ui_state.input_buffer:
+        match ui_state.screen:
+            case Screen.IDLE:
+                enter_player_input()
+            case Screen.PLAYER_INPUT if ui_state.input_buffer:
                 enter_word_count_input()
-        elif ui_state.screen == "word_count":
-            enter_imposter_percent_input()
-        elif ui_state.screen == "imposter_percent":
-            enter_confirm()
-        elif ui_state.screen == "confirm":
-            enter_modes()
-        elif ui_state.screen == "mode_select":
-            select_mode()
-        elif ui_state.screen == "word_entry":
-            if ui_state.word_buffer:
+            case Screen.WORD_COUNT:
+                enter_imposter_percent_input()
+            case Screen.IMPOSTER_PERCENT:
+                enter_confirm()
+            case Screen.CONFIRM:
+                enter_modes()
+            case Screen.MODE_SELECT:
+                select_mode()
+            case Screen.WORD_ENTRY if ui_state.word_buffer:
                 prepare_word_and_start()
-        elif ui_state.screen == "random_pick":
-            lock_random_choice()
+            case Screen.RANDOM_PICK:
+                lock_random_choice()
     elif direction == BACK_DIRECTION:
-        if ui_state.screen == "player_input":
-            reset_idle()
-        elif ui_state.screen == "confirm":
-            enter_imposter_percent_input()
-        elif ui_state.screen == "mode_select":
-            show_mode(ui_state.mode_index - 1)
-        elif ui_state.screen == "word_entry":
-            enter_modes()
-        elif ui_state.screen == "word_count":
-            enter_player_input()
-        elif ui_state.screen == "imposter_percent":
-            enter_word_count_input()
-        elif ui_state.screen == "random_pick":
-            enter_modes()
+        match ui_state.screen:
+            case Screen.PLAYER_INPUT:
+                reset_idle()
+            case Screen.CONFIRM:
+                enter_imposter_percent_input()
+            case Screen.MODE_SELECT:
+                show_mode(ui_state.mode_index - 1)
+            case Screen.WORD_ENTRY:
+                enter_modes()
+            case Screen.WORD_COUNT:
+                enter_player_input()
+            case Screen.IMPOSTER_PERCENT:
+                enter_word_count_input()
+            case Screen.RANDOM_PICK:
+                enter_modes()
+
+
+BACKSPACE_KEYS = frozenset({curses.KEY_BACKSPACE, 127, 8})
+ENTER_KEYS = frozenset({10, 13})
+
+# Screens where Enter acts like scrolling forward.
+ENTER_GO_SCREENS = frozenset(
+    {
+        Screen.WAIT_SCROLL,
+        Screen.REVEAL,
+        Screen.DONE,
+        Screen.PLAYER_INPUT,
+        Screen.WORD_COUNT,
+        Screen.IMPOSTER_PERCENT,
+        Screen.CONFIRM,
+        Screen.MODE_SELECT,
+        Screen.WORD_ENTRY,
+    }
+)
+
+
+# Bit i is set when key code i is accepted; tested with one shift and mask per key.
+DIGIT_MASK = sum(1 << i for i in range(48, 58))
+PRINTABLE_MASK = sum(1 << i for i in range(32, 127))
+
+
+def is_digit_key(ch: int) -> bool:
+    return 0 <= ch < 128 and bool((DIGIT_MASK >> ch) & 1)
+
+
+def is_printable_key(ch: int) -> bool:
+    return 0 <= ch < 128 and bool((PRINTABLE_MASK >> ch) & 1)
+
+
+def apply_key(entry: TextEntry, buf: bytearray, ch: int) -> bool:
+    """Apply a backspace or accepted key to buf and its value; False if the key is not meant for it."""
+    if ch in BACKSPACE_KEYS:
+        del buf[-1:]
+        if entry.value_attr:
+            setattr(ui_state, entry.value_attr, getattr(ui_state, entry.value_attr) // 10)
+        return True
+    if entry.accepts(ch):
+        buf.append(ch)
+        if entry.value_attr:
+            setattr(ui_state, entry.value_attr, getattr(ui_state, entry.value_attr) * 10 + ch - 48)
+        return True
+    return False
+
+
+# Indexed by screen value; None for screens without a text buffer. Built by value, so
+# Screen(value) raises here if the Screen values stop being exactly 0..len(Screen) - 1.
+TEXT_ENTRIES: tuple[Optional[TextEntry], ...] = tuple(
+    {
+        Screen.PLAYER_INPUT: TextEntry("input_buffer", enter_player_input, is_digit_key, value_attr="input_value"),
+        Screen.WORD_COUNT: TextEntry("word_count_buffer", enter_word_count_input, is_digit_key, value_attr="word_count_value"),
+        Screen.IMPOSTER_PERCENT: TextEntry(
+            "imposter_percent_buffer", enter_imposter_percent_input, is_digit_key, value_attr="imposter_percent_value"
+        ),
+        Screen.WORD_ENTRY: TextEntry("word_buffer", enter_word_entry, is_printable_key),
+        Screen.RANDOM_PICK: TextEntry("random_filter", enter_random_pick, is_printable_key, lock_random_choice),
+    }.get(Screen(value))
+    for value in range(len(Screen))
+)
+
+
+def handle_control_key(ch: int, now: float) -> bool:
+    """Handle resize, scroll and Enter keys; False if ch is left for the screen's text entry."""
+    if ch == curses.KEY_RESIZE:
+        ui_state.dirty = True
+        return True
+    if ch == curses.KEY_DOWN or ch == curses.KEY_UP:
+        handle_scroll(GO_DIRECTION if ch == curses.KEY_DOWN else BACK_DIRECTION, now)
+        return True
+    if ch == curses.KEY_MOUSE:
+        try:
+            _, _, _, _, bstate = curses.getmouse()
+        except curses.error:
+            return True
+        if bstate & curses.BUTTON4_PRESSED:
+            handle_scroll("up", now)
+        elif bstate & curses.BUTTON5_PRESSED:
+            handle_scroll("down", now)
+        return True
+    if ch in ENTER_KEYS:
+        if ui_state.screen in ENTER_GO_SCREENS:
+            handle_scroll(GO_DIRECTION, now)
+        elif (entry := TEXT_ENTRIES[ui_state.screen]) is not None and entry.on_enter is not None:
+            entry.on_enter()
+        return True
+    return False
+
+
+def handle_text_key(stdscr: curses.window, entry: TextEntry, ch: int) -> None:
+    """Edit entry's buffer with ch and any keys queued behind it, then refresh its screen once."""
+    buf = getattr(ui_state, entry.buffer_attr)
+    if not buf and ch in BACKSPACE_KEYS:
+        return  # nothing to delete, nothing to redraw
+    if not apply_key(entry, buf, ch):
+        return
+    # Apply keys that are already queued (paste, key repeat) before redrawing once.
+    stdscr.timeout(0)
+    getch = stdscr.getch
+    while (pending := getch()) != -1:
+        if not apply_key(entry, buf, pending):
+            curses.ungetch(pending)
+            break
+    entry.refresh()
 
 
 def run(stdscr: curses.window) -> None:
@@ -807,110 +1255,45 @@ def run(stdscr: curses.window) -> None:
     curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
     curses.mouseinterval(0)
     stdscr.nodelay(True)
-    stdscr.timeout(50)
+    stdscr.bkgd(" ", attr(1, dim=True))
     reset_idle()
 
+    # The loop runs once per key; bind what it touches to locals (LOAD_FAST instead of globals and attributes).
+    state = ui_state
+    entries = TEXT_ENTRIES
+    monotonic = time.monotonic
+    getch = stdscr.getch
+    set_timeout = stdscr.timeout
+    ungetch = curses.ungetch
+
     while True:
-        now = time.monotonic()
+        now = monotonic()
         update_scroll_state(now)
         update_timers(now)
-        render(stdscr)
+        if state.dirty:
+            # Skip the redraw while more input is queued; it is drawn once the queue is empty.
+            set_timeout(0)
+            queued = getch()
+            if queued != -1:
+                ungetch(queued)
+            else:
+                render(stdscr)
+                state.dirty = False
+
+        # Block until input arrives or the next timer is due instead of polling.
+        set_timeout(input_timeout_ms(now))
 
-        ch = stdscr.getch()
+        ch = getch()
         if ch == -1:
+            # Scroll deadlines wake the loop too; only redraw when the shown seconds change.
+            if countdown_changed(monotonic()):
+                state.dirty = True
             continue
-        if ch == curses.KEY_RESIZE:
-            continue
-        if ch in (curses.KEY_DOWN, curses.KEY_UP):
-            direction = GO_DIRECTION if ch == curses.KEY_DOWN else BACK_DIRECTION
-            handle_scroll(direction, now)
-            continue
-        if ch == curses.KEY_MOUSE:
-            try:
-                _, _, _, _, bstate = curses.getmouse()
-            except curses.error:
-                continue
-            direction = None
-            if bstate & curses.BUTTON4_PRESSED:
-                direction = "up"
-            elif bstate & curses.BUTTON5_PRESSED:
-                direction = "down"
-            if direction:
-                handle_scroll(direction, now)
+        if handle_control_key(ch, monotonic()):
             continue
-        if ch in (10, 13):  # Enter
-            if ui_state.screen in ("wait_scroll", "reveal", "done"):
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "player_input":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "word_count":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "imposter_percent":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "confirm":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "mode_select":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "word_entry":
-                handle_scroll(GO_DIRECTION, now)
-                continue
-            if ui_state.screen == "random_pick":
-                lock_random_choice()
-                continue
-        if ui_state.screen == "player_input":
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
-                ui_state.input_buffer = ui_state.input_buffer[:-1]
-                enter_player_input()
-                continue
-            if 48 <= ch <= 57:  # digits
-                ui_state.input_buffer += chr(ch)
-                enter_player_input()
-                continue
-        if ui_state.screen == "word_count":
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
-                ui_state.word_count_buffer = ui_state.word_count_buffer[:-1]
-                enter_word_count_input()
-                continue
-            if 48 <= ch <= 57:
-                ui_state.word_count_buffer += chr(ch)
-                enter_word_count_input()
-                continue
-        if ui_state.screen == "imposter_percent":
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
-                ui_state.imposter_percent_buffer = ui_state.imposter_percent_buffer[:-1]
-                enter_imposter_percent_input()
-                continue
-            if 48 <= ch <= 57:
-                ui_state.imposter_percent_buffer += chr(ch)
-                enter_imposter_percent_input()
-                continue
-        if ui_state.screen == "word_entry":
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
-                ui_state.word_buffer = ui_state.word_buffer[:-1]
-                enter_word_entry()
-                continue
-            if 32 <= ch <= 126:
-                ui_state.word_buffer += chr(ch)
-                enter_word_entry()
-                continue
-        if ui_state.screen == "random_pick":
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
-                ui_state.random_filter = ui_state.random_filter[:-1]
-                enter_random_pick()
-                continue
-            if ch in (10, 13):
-                lock_random_choice()
-                continue
-            if 32 <= ch <= 126:
-                ui_state.random_filter += chr(ch)
-                enter_random_pick()
-                continue
+        entry = entries[state.screen]
+        if entry is not None:
+            handle_text_key(stdscr, entry, ch)
 
 
 def main() -> None: